@@ -1,12 +1,14 @@
+import asyncio
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
 from enum import IntEnum
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Literal
+from typing import Dict, List, Set, Tuple, Optional
 
 # --- Configuration ---
 
-@dataclass
+@dataclass(frozen=True)
 class GameConfig:
     CELL_SIZE: int = 28
     DIMENSIONS: int = 16
@@ -23,20 +25,110 @@ class GameConfig:
 
     # Fonts & Dimensions
     FONT_HINT: Tuple[str, int, str] = ("Calibri", 15, "bold")
+    FONT_MARK: Tuple[str, int, str] = ("Segoe UI", 12, "bold")
     TOP_HINT_HEIGHT: int = 22
     LEFT_HINT_WIDTH: int = 20
 
     LINE_WIDTH_THIN: int = 1
     LINE_WIDTH_THICK: int = 2
 
+    # asyncio polling (ms): fastest when work is ready, slowest when idle
+    ASYNC_POLL_MIN_MS: int = 1
+    ASYNC_POLL_MAX_MS: int = 50
+
 CFG = GameConfig()
 
+# Board size, copied out of CFG; used everywhere below in place of CFG.DIMENSIONS
+DIM = CFG.DIMENSIONS
+
+# Board bitmasks: bit (row * DIM + col) stands for one cell.
+# ROW_MASK keeps one row once shifted down to bit 0; COL_MASKS[c] selects column c.
+ROW_MASK = (1 << DIM) - 1
+COL_MASKS = tuple(sum(1 << (row * DIM + col) for row in range(DIM))
+                  for col in range(DIM))
+
+# Pixel geometry: CELL_COORD[i] is the pixel edge before cell i (and after the last),
+# PIXEL_TO_CELL maps an on-board pixel offset straight to its cell index
+GRID_PIXELS = DIM * CFG.CELL_SIZE
+LAST_PIXEL = GRID_PIXELS - 1
+CELL_COORD = tuple(i * CFG.CELL_SIZE for i in range(DIM + 1))
+PIXEL_TO_CELL = bytes(p // CFG.CELL_SIZE for p in range(GRID_PIXELS))
+
+# Hidden ? marks are moved this many pixels left of their cell, outside the view
+MARK_OFFSCREEN = 10000
+
 class CellState(IntEnum):
     EMPTY = 0
     FILLED = 1
     X = 2
     MAYBE = 3
 
+# Plain-int copies of CellState for hot paths (IntEnum compares are slower)
+_EMPTY = int(CellState.EMPTY)
+_FILLED = int(CellState.FILLED)
+_X = int(CellState.X)
+_MAYBE = int(CellState.MAYBE)
+
+# Modifier bits in event.state
+SHIFT_MASK = 0x0001
+CONTROL_MASK = 0x0004
+MODIFIER_MASK = SHIFT_MASK | CONTROL_MASK
+# (Mouse button, held modifiers) -> state it paints, as a plain int for the hot path.
+# Left: Fill • Middle: Maybe • Right: X • Mouse 5: Erase
+# Shift+Left: Maybe • Ctrl+Left: X (also with Shift held, as Ctrl-Button-1 was bound last)
+BUTTON_STATES = {
+    (1, 0): _FILLED,
+    (1, SHIFT_MASK): _MAYBE,
+    (1, CONTROL_MASK): _X,
+    (1, MODIFIER_MASK): _X,
+    (2, 0): _MAYBE,
+    (3, 0): _X,
+    (5, 0): _EMPTY,
+}
+# Any of Button1..Button5 held down, in event.state
+BUTTON_MASK = 0x1F00
+
+# Bindtag shared by every hint Entry for arrow-key navigation
+HINT_BINDTAG = "PicrossHint"
+# Arrow key -> (d_line, d_index) within a hint list.
+# Row hints are stored per row, so Up/Down change the row.
+ROW_HINT_MOVES = {"Up": (-1, 0), "Down": (1, 0), "Left": (0, -1), "Right": (0, 1)}
+# Column hints are stored per column, so Left/Right change the column.
+COL_HINT_MOVES = {"Up": (0, -1), "Down": (0, 1), "Left": (-1, 0), "Right": (1, 0)}
+# Hint digit -> text color (anything else is black)
+HINT_COLORS = {
+    "1": "#BA031B",  # Red
+    "2": "#FF7A00",  # Orange
+    "3": "#E5B500",  # Yellow
+    "4": "#5ABB00",  # Green
+    "5": "#1E5BFF",  # Blue
+    "6": "#6F29E7",  # Purple
+    "7": "#7FAEE8",  # White
+    "8": "black",      # Black
+    "9": "#00B2B2",  # Teal Cyan (glass)
+}
+
+def grid_polyline(xs, ys, width, height) -> List[float]:
+    """
+    Coordinates for one polyline that draws a vertical line at every x in xs and
+    a horizontal line at every y in ys across a width x height canvas.
+    The runs joining one line to the next lie outside the canvas, so they are clipped.
+    """
+    margin = CFG.LINE_WIDTH_THICK * 2
+    coords = []
+    start, end = -margin, height + margin
+    for x in xs:
+        coords += (x, start, x, end)
+        start, end = end, start
+    left, right = -margin, width + margin
+    if xs and ys:
+        # Run along the outside edge to the left side, then down to the first y
+        coords += (left, start)
+    for y in ys:
+        coords += (left, y, right, y)
+        left, right = right, left
+    return coords
+
 # --- Custom Widgets ---
 
 class PicrossGrid(tk.Canvas):
@@ -44,173 +136,277 @@ class PicrossGrid(tk.Canvas):
     Handles the drawing of the main game grid and mouse interactions.
     """
     def __init__(self, master, **kwargs):
-        width = CFG.DIMENSIONS * CFG.CELL_SIZE
-        height = CFG.DIMENSIONS * CFG.CELL_SIZE
+        width = height = GRID_PIXELS
         super().__init__(master, width=width, height=height,
                          bg=CFG.COLOR_BG_GRID, highlightthickness=0, **kwargs)
 
-        # Internal State
-        self.grid_state = [[CellState.EMPTY for _ in range(CFG.DIMENSIONS)]
-                           for _ in range(CFG.DIMENSIONS)]
-        self.rect_ids = [[None for _ in range(CFG.DIMENSIONS)]
-                         for _ in range(CFG.DIMENSIONS)]
-        self.mark_tags = [[f"mark_{row}_{col}" for col in range(CFG.DIMENSIONS)]
-                          for row in range(CFG.DIMENSIONS)]
+        # Internal State (flat, row-major: index = row * DIM + col)
+        cell_count = DIM * DIM
+        self.grid_state = bytearray(cell_count)  # one CellState value per byte
+        # Bitboards of FILLED and X cells, for whole-row/column queries
+        self.filled_mask = 0
+        self.x_mask = 0
+        self.overlay_q_ids: List[Optional[int]] = [None] * cell_count  # created on first use
+
+        # Board Image: cell backgrounds and X marks are tiles copied into one image
+        self.grid_image = tk.PhotoImage(master=self, width=width, height=height)
+        empty_tile = self._make_tile(CFG.COLOR_BG_GRID)
+        # Indexed by CellState value; "?" is drawn as text on top of an empty tile
+        self.cell_tiles = (
+            empty_tile,                                                        # EMPTY
+            self._make_tile(CFG.COLOR_CELL_FILLED),                            # FILLED
+            self._make_tile(CFG.COLOR_BG_GRID, mark_color=CFG.COLOR_CELL_X),  # X
+            empty_tile,                                                        # MAYBE
+        )
+
+        # Cell updates call Tcl directly with this widget's path, skipping the
+        # option-dict handling in Canvas.itemconfig
+        self._tk_call = self.tk.call
+        self._path = str(self)
+
+        # Shared font for every "?" mark (kept referenced so Tk keeps it alive)
+        self.mark_font = tkfont.Font(root=self, font=CFG.FONT_MARK)
+
+        # Cell Geometry (pixel rectangle per cell, computed once)
+        self.cell_rects: List[Tuple[int, int, int, int]] = [
+            (CELL_COORD[col], CELL_COORD[row], CELL_COORD[col + 1], CELL_COORD[row + 1])
+            for row in range(DIM) for col in range(DIM)]
 
         # Dragging State
         self._is_dragging = False
-        self._drag_target_state = CellState.EMPTY
+        self._drag_button = 0
+        self._drag_target_state = _EMPTY
         self._drag_start_cell: Optional[Tuple[int, int]] = None
-        self._drag_axis: Optional[Literal['row', 'col']] = None
+        # Axis lock: the row or column index a drag is pinned to, -1 while unlocked
+        self._lock_row = -1
+        self._lock_col = -1
+        self._last_paint_cell: Optional[Tuple[int, int]] = None
+        self._last_pointer_cell: Optional[Tuple[int, int]] = None
+
+        # Motion Coalescing (latest pointer position awaiting an idle pass)
+        self._pending_motion: Optional[Tuple[int, int]] = None
 
         self._init_draw()
         self._bind_events()
 
+    def _make_tile(self, fill, mark_color=None) -> tk.PhotoImage:
+        """Builds one cell-sized image, optionally crossed with an X mark."""
+        size = CFG.CELL_SIZE
+        tile = tk.PhotoImage(master=self, width=size, height=size)
+        tile.put(fill, to=(0, 0, size, size))
+        if mark_color:
+            # Two 2px diagonals inset by pad, mirrored top-to-bottom
+            pad = 6
+            for i in range(pad, size - pad):
+                tile.put(mark_color, to=(i, i, i + 2, i + 2))
+                tile.put(mark_color, to=(i, size - 2 - i, i + 2, size - i))
+        return tile
+
     def _init_draw(self):
-        """Draws the initial grid lines and empty cell rectangles."""
-        # 1. Cell backgrounds
-        for row in range(CFG.DIMENSIONS):
-            for col in range(CFG.DIMENSIONS):
-                x0, y0 = col * CFG.CELL_SIZE, row * CFG.CELL_SIZE
-                x1, y1 = x0 + CFG.CELL_SIZE, y0 + CFG.CELL_SIZE
-                rid = self.create_rectangle(x0, y0, x1, y1, fill=CFG.COLOR_BG_GRID, width=0)
-                self.rect_ids[row][col] = rid
-
-        # 2. Grid lines
-        total_size = CFG.DIMENSIONS * CFG.CELL_SIZE
-        for i in range(1, CFG.DIMENSIONS):
-            width = CFG.LINE_WIDTH_THICK if i % CFG.BLOCK_INTERVAL == 0 else CFG.LINE_WIDTH_THIN
-            pos = i * CFG.CELL_SIZE
-            self.create_line(pos, 0, pos, total_size, fill=CFG.COLOR_GRID_LINE, width=width)
-            self.create_line(0, pos, total_size, pos, fill=CFG.COLOR_GRID_LINE, width=width)
+        """Draws the board image and grid lines."""
+        # 1. Cell backgrounds (one image item for the whole board)
+        self.grid_image.put(CFG.COLOR_BG_GRID, to=(0, 0, self.grid_image.width(),
+                                                   self.grid_image.height()))
+        self.create_image(0, 0, anchor="nw", image=self.grid_image)
+
+        # 2. Grid lines (one polyline item per line width)
+        total_size = GRID_PIXELS
+        thin, thick = [], []
+        for i in range(1, DIM):
+            (thick if i % CFG.BLOCK_INTERVAL == 0 else thin).append(CELL_COORD[i])
+        for positions, width in ((thin, CFG.LINE_WIDTH_THIN), (thick, CFG.LINE_WIDTH_THICK)):
+            if positions:
+                self.create_line(*grid_polyline(positions, positions, total_size, total_size),
+                                 fill=CFG.COLOR_GRID_LINE, width=width)
 
         # 3. Outer Border
-        inset = CFG.LINE_WIDTH_THICK / 2
+        inset = CFG.LINE_WIDTH_THICK // 2
         self.create_rectangle(inset, inset, total_size - inset, total_size - inset,
                               outline=CFG.COLOR_GRID_LINE, width=CFG.LINE_WIDTH_THICK)
 
     def _bind_events(self):
-        # Left Click: Fill
-        self.bind("<Button-1>", lambda e: self._on_press(e, CellState.FILLED))
-        self.bind("<B1-Motion>", self._on_drag)
-        self.bind("<ButtonRelease-1>", self._end_drag)
-
-        # Middle / Shift+Left: Maybe
-        self.bind("<Button-2>", lambda e: self._on_press(e, CellState.MAYBE))
-        self.bind("<B2-Motion>", self._on_drag)
-        self.bind("<ButtonRelease-2>", self._end_drag)
-        self.bind("<Shift-Button-1>", lambda e: self._on_press(e, CellState.MAYBE))
-        self.bind("<Shift-B1-Motion>", self._on_drag)
-        self.bind("<Shift-ButtonRelease-1>", self._end_drag)
-
-        # Right / Ctrl+Left: X
-        self.bind("<Button-3>", lambda e: self._on_press(e, CellState.X))
-        self.bind("<B3-Motion>", self._on_drag)
-        self.bind("<ButtonRelease-3>", self._end_drag)
-        self.bind("<Control-Button-1>", lambda e: self._on_press(e, CellState.X))
-        self.bind("<Control-B1-Motion>", self._on_drag)
-        self.bind("<Control-ButtonRelease-1>", self._end_drag)
-
-        # Mouse 5: Erase
-        self.bind("<Button-5>", lambda e: self._on_press(e, CellState.EMPTY))
-        self.bind("<B5-Motion>", self._on_drag)
-        self.bind("<ButtonRelease-5>", self._end_drag)
+        # One binding per event type; the button (and modifiers) pick the state
+        self.bind("<ButtonPress>", self._on_button_press)
+        self.bind("<Motion>", self._on_drag)
+        self.bind("<ButtonRelease>", self._end_drag)
+
+    def _on_button_press(self, event):
+        desired_state = BUTTON_STATES.get((event.num, event.state & MODIFIER_MASK))
+        if desired_state is None:
+            # Modifiers only matter where listed; otherwise use the plain button
+            desired_state = BUTTON_STATES.get((event.num, 0))
+            if desired_state is None: return
+        # Painting takes keyboard focus away from the hint entries
+        self.focus_set()
+        self._drag_button = event.num
+        self._on_press(event, desired_state)
 
     def reset_grid(self):
-        for row in range(CFG.DIMENSIONS):
-            for col in range(CFG.DIMENSIONS):
-                self._update_cell(row, col, CellState.EMPTY)
-
-    def _get_cell_coords(self, event) -> Optional[Tuple[int, int]]:
-        col = event.x // CFG.CELL_SIZE
-        row = event.y // CFG.CELL_SIZE
-        if 0 <= row < CFG.DIMENSIONS and 0 <= col < CFG.DIMENSIONS:
-            return int(row), int(col)
-        return None
+        # Clear every cell with one image fill, then park the ? marks still shown
+        for idx, state in enumerate(self.grid_state):
+            if state == _MAYBE:
+                self.move(self.overlay_q_ids[idx], -MARK_OFFSCREEN, 0)
+        self.grid_image.put(CFG.COLOR_BG_GRID, to=(0, 0, self.grid_image.width(),
+                                                   self.grid_image.height()))
+        self.grid_state[:] = bytes(len(self.grid_state))
+        self.filled_mask = 0
+        self.x_mask = 0
+
+    def _state_mask(self, state) -> int:
+        """Board bitmask for `state`; only FILLED and X cells are tracked."""
+        if state == _FILLED:
+            return self.filled_mask
+        if state == _X:
+            return self.x_mask
+        raise ValueError(f"no bitmask is kept for {CellState(state).name} cells")
+
+    def row_bits(self, row, state=CellState.FILLED) -> int:
+        """Bit c is set if cell (row, c) is in `state` (FILLED or X)."""
+        mask = self._state_mask(state)
+        return (mask >> (row * DIM)) & ROW_MASK
+
+    def col_bits(self, col, state=CellState.FILLED) -> int:
+        """Bit r is set if cell (r, col) is in `state` (FILLED or X)."""
+        mask = self._state_mask(state)
+        column = (mask & COL_MASKS[col]) >> col
+        bits = 0
+        row = 0
+        while column:
+            bits |= (column & 1) << row
+            column >>= DIM
+            row += 1
+        return bits
+
+    def _get_cell_coords(self, x, y) -> Tuple[int, int]:
+        """Cell under pixel (x, y), clamped to the nearest edge cell."""
+        return (PIXEL_TO_CELL[max(0, min(LAST_PIXEL, y))],
+                PIXEL_TO_CELL[max(0, min(LAST_PIXEL, x))])
 
     def _update_cell(self, row, col, state):
-        if self.grid_state[row][col] == state:
+        idx = row * DIM + col
+        prev_state = self.grid_state[idx]
+        if prev_state == state:
             return
 
-        self.grid_state[row][col] = state
-        rid = self.rect_ids[row][col]
-        tag = self.mark_tags[row][col]
-
-        # Cleanup old marks
-        self.delete(tag)
-
-        # Update Background
-        fill = CFG.COLOR_CELL_FILLED if state == CellState.FILLED else CFG.COLOR_BG_GRID
-        self.itemconfig(rid, fill=fill)
-
-        # Draw Overlay (X or ?)
-        x0, y0 = col * CFG.CELL_SIZE, row * CFG.CELL_SIZE
-        x1, y1 = x0 + CFG.CELL_SIZE, y0 + CFG.CELL_SIZE
-
-        if state == CellState.X:
-            pad = 6
-            self.create_line(x0+pad, y0+pad, x1-pad, y1-pad, fill=CFG.COLOR_CELL_X, width=2, tags=tag)
-            self.create_line(x0+pad, y1-pad, x1-pad, y0+pad, fill=CFG.COLOR_CELL_X, width=2, tags=tag)
-        elif state == CellState.MAYBE:
-            cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
-            self.create_text(cx, cy, text="?", fill=CFG.COLOR_CELL_MAYBE,
-                             font=("Segoe UI", 12, "bold"), tags=tag)
+        self.grid_state[idx] = state
+        bit = 1 << idx
+        if state == _FILLED:
+            self.filled_mask |= bit
+        elif prev_state == _FILLED:
+            self.filled_mask &= ~bit
+        if state == _X:
+            self.x_mask |= bit
+        elif prev_state == _X:
+            self.x_mask &= ~bit
+
+        # Hide old ? mark
+        if prev_state == _MAYBE:
+            self._tk_call(self._path, "move", self.overlay_q_ids[idx], -MARK_OFFSCREEN, 0)
+
+        # Update Background (and X mark) by copying the state's tile into the board,
+        # unless it is unchanged (EMPTY <-> MAYBE share a tile)
+        tile = self.cell_tiles[state]
+        if tile is not self.cell_tiles[prev_state]:
+            x0, y0, _, _ = self.cell_rects[idx]
+            self._tk_call(self.grid_image, "copy", tile, "-to", x0, y0)
+
+        # Show ? mark (created the first time this cell needs one, then reused)
+        if state == _MAYBE:
+            qid = self.overlay_q_ids[idx]
+            if qid is None:
+                x0, y0, x1, y1 = self.cell_rects[idx]
+                self.overlay_q_ids[idx] = self.create_text(
+                    (x0 + x1) / 2, (y0 + y1) / 2, text="?", fill=CFG.COLOR_CELL_MAYBE,
+                    font=self.mark_font)
+            else:
+                self._tk_call(self._path, "move", qid, MARK_OFFSCREEN, 0)
 
     def _on_press(self, event, desired_state):
-        cell = self._get_cell_coords(event)
-        if not cell: return
-
-        row, col = cell
-        current_state = self.grid_state[row][col]
+        row, col = self._get_cell_coords(event.x, event.y)
+        current_state = self.grid_state[row * DIM + col]
 
         # Toggle logic
         if current_state == desired_state:
-            self._drag_target_state = CellState.EMPTY
+            self._drag_target_state = _EMPTY
         else:
             self._drag_target_state = desired_state
 
         self._is_dragging = True
         self._drag_start_cell = (row, col)
-        self._drag_axis = None
+        self._lock_row = -1
+        self._lock_col = -1
+        self._last_paint_cell = (row, col)
+        self._last_pointer_cell = (row, col)
+        self._pending_motion = None
 
         self._update_cell(row, col, self._drag_target_state)
 
     def _on_drag(self, event):
-        if not self._is_dragging: return
-
+        # <Motion> also fires while hovering; only drags with a button held count
+        if not self._is_dragging or not event.state & BUTTON_MASK: return
+
+        # Only remember the latest position; intermediate motion events are
+        # dropped and painted once per idle pass.
+        if self._pending_motion is None:
+            self.after_idle(self._flush_motion)
+        self._pending_motion = (event.x, event.y)
+
+    def _flush_motion(self):
+        motion = self._pending_motion
+        self._pending_motion = None
+        if motion is None or not self._is_dragging: return
         # Get mouse position clamped to grid
-        col = max(0, min(CFG.DIMENSIONS - 1, event.x // CFG.CELL_SIZE))
-        row = max(0, min(CFG.DIMENSIONS - 1, event.y // CFG.CELL_SIZE))
-
-        start_row, start_col = self._drag_start_cell
-
-        # Determine Lock Axis if not set
-        if self._drag_axis is None:
-            if row != start_row and col == start_col:
-                self._drag_axis = 'col'
-            elif col != start_col and row == start_row:
-                self._drag_axis = 'row'
-            elif row != start_row and col != start_col:
-                # Diagonal move: pick dominant axis
-                if abs(row - start_row) > abs(col - start_col):
-                    self._drag_axis = 'col'
-                else:
-                    self._drag_axis = 'row'
-
-        # Apply Lock
-        target_row, target_col = row, col
-        if self._drag_axis == 'row':
-            target_row = start_row
-        elif self._drag_axis == 'col':
-            target_col = start_col
-
-        # Paint
-        self._update_cell(target_row, target_col, self._drag_target_state)
+        row, col = self._get_cell_coords(*motion)
+
+        # Motion within the same cell as last time changes nothing
+        if (row, col) == self._last_pointer_cell: return
+        self._last_pointer_cell = (row, col)
+
+        # Locked drags only need the free coordinate
+        if self._lock_row >= 0:
+            target_row, target_col = self._lock_row, col
+        elif self._lock_col >= 0:
+            target_row, target_col = row, self._lock_col
+        else:
+            # First move off the start cell decides the lock axis: the one the
+            # pointer moved further along (ties, and pure row moves, lock the row)
+            start_row, start_col = self._drag_start_cell
+            if abs(row - start_row) > abs(col - start_col):
+                self._lock_col = start_col
+                target_row, target_col = row, start_col
+            else:
+                self._lock_row = start_row
+                target_row, target_col = start_row, col
+
+        # Skip repeat events over the cell that was just painted
+        last_row, last_col = self._last_paint_cell
+        if target_row == last_row and target_col == last_col: return
+        self._last_paint_cell = (target_row, target_col)
+
+        # Paint every cell from the last painted one up to the target, so fast
+        # drags leave no gaps. Both lie on the locked line (or the start cell).
+        state = self._drag_target_state
+        if target_row == last_row:
+            step = 1 if target_col > last_col else -1
+            for col in range(last_col + step, target_col + step, step):
+                self._update_cell(target_row, col, state)
+        else:
+            step = 1 if target_row > last_row else -1
+            for row in range(last_row + step, target_row + step, step):
+                self._update_cell(row, target_col, state)
 
     def _end_drag(self, event):
+        # Only releasing the button that started the drag ends it
+        if event.num != self._drag_button: return
+        # Paint any motion still waiting for its idle pass
+        self._flush_motion()
         self._is_dragging = False
         self._drag_start_cell = None
-        self._drag_axis = None
+        self._lock_row = -1
+        self._lock_col = -1
+        self._last_paint_cell = None
+        self._last_pointer_cell = None
+        self._drag_button = 0
 
 
 # --- Main Application ---
@@ -219,15 +415,25 @@ class PicrossApp(tk.Tk):
 
     def __init__(self):
         super().__init__()
-        self.title(f"Picross {CFG.DIMENSIONS}×{CFG.DIMENSIONS}")
+        self.title(f"Picross {DIM}×{DIM}")
         self.resizable(False, False)
 
-        self.row_hints: List[List[tk.Entry]] = []
-        self.col_hints: List[List[tk.Entry]] = []
+        # Hint entries are created on first use (see _hint_entry); None until then
+        self.row_hints: List[List[Optional[tk.Entry]]] = [
+            [None] * CFG.HINTS_PER_SIDE for _ in range(DIM)]
+        self.col_hints: List[List[Optional[tk.Entry]]] = [
+            [None] * CFG.HINTS_PER_SIDE for _ in range(DIM)]
+        # Tk path name -> hint Entry, for the shared validate command
+        self._hint_widgets: Dict[str, tk.Entry] = {}
+        # Canvas -> (width, height) its separators were last drawn for
+        self._sep_sizes: Dict[tk.Canvas, Tuple[int, int]] = {}
+        self.loop: Optional[asyncio.AbstractEventLoop] = None  # set by run()
+        # Coroutines from submit() that have not finished, and the pending tick
+        self._async_tasks: Set[asyncio.Task] = set()
+        self._async_tick_id: Optional[str] = None
 
         self._build_layout()
         self._bind_navigation()
-        self._bind_focus_clear()
 
 
     def validate_and_color(self, P, widget_id):
@@ -236,19 +442,7 @@ class PicrossApp(tk.Tk):
             return False
 
         # Update color based on hint number
-        colors = {
-            "1": "#BA031B",  # Red
-            "2": "#FF7A00",  # Orange
-            "3": "#E5B500",  # Yellow
-            "4": "#5ABB00",  # Green
-            "5": "#1E5BFF",  # Blue
-            "6": "#6F29E7",  # Purple
-            "7": "#7FAEE8",  # White
-            "8": "black",      # Black
-            "9": "#00B2B2",  # Teal Cyan (glass)
-        }
-        widget = self.nametowidget(widget_id)
-        widget.config(fg=colors.get(P, "black"))
+        self._hint_widgets[widget_id].config(fg=HINT_COLORS.get(P, "black"))
         return True
 
 
@@ -269,7 +463,7 @@ class PicrossApp(tk.Tk):
         area.grid(row=1, column=0)
 
         # --- Top Hints (Column Hints) ---
-        top_w = CFG.DIMENSIONS * CFG.CELL_SIZE
+        top_w = DIM * CFG.CELL_SIZE
         top_h = CFG.HINTS_PER_SIDE * CFG.TOP_HINT_HEIGHT
 
         self.col_sep_canvas = tk.Canvas(
@@ -285,28 +479,12 @@ class PicrossApp(tk.Tk):
         self.col_sep_canvas.bind("<Configure>",
             lambda e: self._draw_separators(self.col_sep_canvas, e.width, e.height, vertical=True))
 
-        # Place the Entry widgets over the canvas
-        vcmd = self.register(self.validate_and_color)
-        for col in range(CFG.DIMENSIONS):
-            # Frame for one column of hints
-            col_entries = []
-            for i in range(CFG.HINTS_PER_SIDE):
-                x = col * CFG.CELL_SIZE + CFG.CELL_SIZE / 2
-                y = i * CFG.TOP_HINT_HEIGHT + CFG.TOP_HINT_HEIGHT / 2
-                e = tk.Entry(self.col_sep_canvas, justify="center",
-                             bg=CFG.COLOR_BG_HINT, relief="flat", bd=0,
-                             font=CFG.FONT_HINT)
-                e.config(validate="key", validatecommand=(vcmd, "%P", str(e)))
-                self.col_sep_canvas.create_window(x, y,
-                                                  width=CFG.CELL_SIZE - 4,
-                                                  height=CFG.TOP_HINT_HEIGHT - 4,
-                                                  window=e)
-                col_entries.append(e)
-            self.col_hints.append(col_entries)
+        # Entry widgets are placed over the canvas when a slot is first clicked
+        self.col_sep_canvas.bind("<Button-1>", self._on_col_hint_click)
 
         # --- Left Hints (Row Hints) ---
         left_w = CFG.HINTS_PER_SIDE * CFG.LEFT_HINT_WIDTH
-        left_h = CFG.DIMENSIONS * CFG.CELL_SIZE
+        left_h = DIM * CFG.CELL_SIZE
 
         self.row_sep_canvas = tk.Canvas(
             area,
@@ -321,22 +499,11 @@ class PicrossApp(tk.Tk):
         self.row_sep_canvas.bind("<Configure>",
             lambda e: self._draw_separators(self.row_sep_canvas, e.width, e.height, vertical=False))
 
-        for row in range(CFG.DIMENSIONS):
-            row_entries = []
-            for i in range(CFG.HINTS_PER_SIDE):
-                x = i * CFG.LEFT_HINT_WIDTH + CFG.LEFT_HINT_WIDTH / 2
-                y = row * CFG.CELL_SIZE + CFG.CELL_SIZE / 2
-
-                e = tk.Entry(self.row_sep_canvas, justify="center",
-                             bg=CFG.COLOR_BG_HINT, relief="flat", bd=0,
-                             font=CFG.FONT_HINT)
-                e.config(validate="key", validatecommand=(vcmd, "%P", str(e)))
-                self.row_sep_canvas.create_window(x, y,
-                                                  width=CFG.LEFT_HINT_WIDTH - 4,
-                                                  height=CFG.CELL_SIZE - 4,
-                                                  window=e)
-                row_entries.append(e)
-            self.row_hints.append(row_entries)
+        self.row_sep_canvas.bind("<Button-1>", self._on_row_hint_click)
+
+        # Shared by every hint Entry
+        self.hint_font = tkfont.Font(root=self, font=CFG.FONT_HINT)
+        self._vcmd = self.register(self.validate_and_color)
 
         # --- Main Grid ---
         self.grid_canvas = PicrossGrid(area)
@@ -347,81 +514,182 @@ class PicrossApp(tk.Tk):
         Draws separation lines on the canvas.
         vertical=True (Top Hints): Draws ONLY vertical lines (separating columns).
         vertical=False (Left Hints): Draws ONLY horizontal lines (separating rows).
+        Does nothing if the lines are already drawn for this size.
         """
+        if self._sep_sizes.get(canvas) == (width, height):
+            return
+        self._sep_sizes[canvas] = (width, height)
         canvas.delete("lines")
-        step = CFG.CELL_SIZE
-        tags = ("lines",)
+        thin, thick = [], []
 
-        # Loop 0 to DIMENSIONS (inclusive) to draw start edge, internal lines, and end edge.
-        for i in range(0, CFG.DIMENSIONS + 1):
+        # Loop 0 to DIM (inclusive) to draw start edge, internal lines, and end edge.
+        for i in range(0, DIM + 1):
             # Thick lines every BLOCK_INTERVAL, and at edges (0, 16)
-            line_w = CFG.LINE_WIDTH_THICK if i % CFG.BLOCK_INTERVAL == 0 else CFG.LINE_WIDTH_THIN
-            pos = i * step
+            is_thick = i % CFG.BLOCK_INTERVAL == 0
+            line_w = CFG.LINE_WIDTH_THICK if is_thick else CFG.LINE_WIDTH_THIN
+            pos = CELL_COORD[i]
 
             # Offset edges to prevent clipping
             # If line is at 0, shift right by half width.
             # If line is at max width, shift left by half width.
             if i == 0:
                 pos += line_w / 2
-            elif i == CFG.DIMENSIONS:
+            elif i == DIM:
                 pos -= line_w / 2
 
+            (thick if is_thick else thin).append(pos)
+
+        # One polyline per line width.
+        # Top Hints: x positions of vertical lines. Left Hints: y positions of horizontal lines.
+        for positions, line_w in ((thin, CFG.LINE_WIDTH_THIN), (thick, CFG.LINE_WIDTH_THICK)):
+            if not positions: continue
             if vertical:
-                # Top Hints: Vertical lines only
-                # pos is x-coordinate. Draw from y=0 to y=height.
-                canvas.create_line(pos, 0, pos, height, fill=CFG.COLOR_GRID_LINE, width=line_w, tags=tags)
+                coords = grid_polyline(positions, (), width, height)
             else:
-                # Left Hints: Horizontal lines only
-                # pos is y-coordinate. Draw from x=0 to x=width.
-                canvas.create_line(0, pos, width, pos, fill=CFG.COLOR_GRID_LINE, width=line_w, tags=tags)
+                coords = grid_polyline((), positions, width, height)
+            canvas.create_line(*coords, fill=CFG.COLOR_GRID_LINE, width=line_w, tags=("lines",))
+
+    def _hint_entry(self, entry_list, line, i) -> tk.Entry:
+        """
+        Returns the hint Entry at entry_list[line][i]. The first time any slot of a
+        line is needed, the whole line's entries are created together.
+        """
+        e = entry_list[line][i]
+        if e is None:
+            self._create_hint_line(entry_list, line)
+            e = entry_list[line][i]
+        return e
+
+    def _create_hint_line(self, entry_list, line):
+        """
+        Creates the Entry widgets for one line of hints. Tab follows stacking
+        order, so the new entries are lowered below any later line that already
+        exists: Tab then walks the existing hints in line order and skips lines
+        that have never been used.
+        """
+        later = next((row[0] for row in entry_list[line + 1:] if row[0] is not None), None)
+        for i in range(CFG.HINTS_PER_SIDE):
+            e = self._create_hint_entry(entry_list, line, i)
+            if later is not None:
+                e.lower(later)
+
+    def _create_hint_entry(self, entry_list, line, i) -> tk.Entry:
+        if entry_list is self.col_hints:
+            canvas, moves = self.col_sep_canvas, COL_HINT_MOVES
+            x = line * CFG.CELL_SIZE + CFG.CELL_SIZE / 2
+            y = i * CFG.TOP_HINT_HEIGHT + CFG.TOP_HINT_HEIGHT / 2
+            width, height = CFG.CELL_SIZE - 4, CFG.TOP_HINT_HEIGHT - 4
+        else:
+            canvas, moves = self.row_sep_canvas, ROW_HINT_MOVES
+            x = i * CFG.LEFT_HINT_WIDTH + CFG.LEFT_HINT_WIDTH / 2
+            y = line * CFG.CELL_SIZE + CFG.CELL_SIZE / 2
+            width, height = CFG.LEFT_HINT_WIDTH - 4, CFG.CELL_SIZE - 4
+
+        # The highlight border blends into the hint background until focused, so a
+        # created-but-empty slot looks like one that was never used. This drops the
+        # grey unfocused outline Tk's default highlightbackground draws on X11.
+        e = tk.Entry(canvas, justify="center",
+                     bg=CFG.COLOR_BG_HINT, highlightbackground=CFG.COLOR_BG_HINT,
+                     relief="flat", bd=0, font=self.hint_font)
+        self._hint_widgets[str(e)] = e
+        e.config(validate="key", validatecommand=(self._vcmd, "%P", "%W"))
+        canvas.create_window(x, y, width=width, height=height, window=e)
+
+        # Each entry remembers where it sits and carries a shared bindtag, so the
+        # arrow keys are bound once for all hints (ahead of the Entry class bindings).
+        e.hint_pos = (entry_list, line, i, moves)
+        e.bindtags((HINT_BINDTAG,) + e.bindtags())
+        entry_list[line][i] = e
+        return e
+
+    def _on_col_hint_click(self, event):
+        col = max(0, min(DIM - 1, event.x // CFG.CELL_SIZE))
+        i = max(0, min(CFG.HINTS_PER_SIDE - 1, event.y // CFG.TOP_HINT_HEIGHT))
+        self._focus_hint(self._hint_entry(self.col_hints, col, i))
+        return "break"
+
+    def _on_row_hint_click(self, event):
+        row = max(0, min(DIM - 1, event.y // CFG.CELL_SIZE))
+        i = max(0, min(CFG.HINTS_PER_SIDE - 1, event.x // CFG.LEFT_HINT_WIDTH))
+        self._focus_hint(self._hint_entry(self.row_hints, row, i))
+        return "break"
+
+    def _focus_hint(self, target):
+        target.focus_set()
+        target.icursor(tk.END)
+        target.selection_range(0, tk.END)
 
     def _bind_navigation(self):
         """Binds arrow keys to navigate the hint grids."""
-        def move_focus(entry_list, row, col, dr, dc):
-            nr, nc = row + dr, col + dc
-            if 0 <= nr < len(entry_list) and 0 <= nc < len(entry_list[0]):
-                target = entry_list[nr][nc]
-                target.focus_set()
-                target.icursor(tk.END)
-                target.selection_range(0, tk.END)
-                return "break"
-
-        # Row Hints (Left)
-        for row in range(CFG.DIMENSIONS):
-            for i in range(CFG.HINTS_PER_SIDE):
-                e = self.row_hints[row][i]
-                e.bind("<Up>",    lambda _, row=row, i=i: move_focus(self.row_hints, row, i, -1, 0))
-                e.bind("<Down>",  lambda _, row=row, i=i: move_focus(self.row_hints, row, i, 1, 0))
-                e.bind("<Left>",  lambda _, row=row, i=i: move_focus(self.row_hints, row, i, 0, -1))
-                e.bind("<Right>", lambda _, row=row, i=i: move_focus(self.row_hints, row, i, 0, 1))
-
-        # Col Hints (Top)
-        for col in range(CFG.DIMENSIONS):
-            for i in range(CFG.HINTS_PER_SIDE):
-                e = self.col_hints[col][i]
-                e.bind("<Up>",    lambda _, col=col, i=i: move_focus(self.col_hints, col, i, 0, -1))
-                e.bind("<Down>",  lambda _, col=col, i=i: move_focus(self.col_hints, col, i, 0, 1))
-                e.bind("<Left>",  lambda _, col=col, i=i: move_focus(self.col_hints, col, i, -1, 0))
-                e.bind("<Right>", lambda _, col=col, i=i: move_focus(self.col_hints, col, i, 1, 0))
-
-    def _bind_focus_clear(self):
-        # Clicking anywhere on the grid or root clears hint focus
-        self.bind_all("<Button-1>", self._clear_hint_focus, add="+")
-
-    def _clear_hint_focus(self, event):
-        widget = event.widget
-        # If clicked widget is NOT an Entry, remove focus from hint entries
-        if not isinstance(widget, tk.Entry):
-            self.grid_canvas.focus_set()
+        for key in ROW_HINT_MOVES:
+            self.bind_class(HINT_BINDTAG, f"<{key}>", self._on_hint_key)
+
+    def _on_hint_key(self, event):
+        entry_list, row, col, moves = event.widget.hint_pos
+        dr, dc = moves[event.keysym]
+        nr, nc = row + dr, col + dc
+        if 0 <= nr < len(entry_list) and 0 <= nc < len(entry_list[0]):
+            self._focus_hint(self._hint_entry(entry_list, nr, nc))
+            return "break"
 
     def reset_board(self):
         self.grid_canvas.reset_grid()
 
     def clear_hints(self):
         for row in self.row_hints:
-            for e in row: e.delete(0, tk.END)
+            for e in row:
+                if e is not None: e.delete(0, tk.END)
         for col in self.col_hints:
-            for e in col: e.delete(0, tk.END)
+            for e in col:
+                if e is not None: e.delete(0, tk.END)
+
+    def run(self):
+        """
+        Runs the Tk mainloop with an asyncio loop alongside it. The loop is only
+        stepped from Tk timers while coroutines passed to submit() are running,
+        so an idle app never wakes up for it.
+        """
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.mainloop()
+        finally:
+            self.loop.close()
+
+    def submit(self, coro) -> asyncio.Task:
+        """Schedules coro on self.loop and steps the loop until it has finished."""
+        task = self.loop.create_task(coro)
+        self._async_tasks.add(task)
+        task.add_done_callback(self._async_tasks.discard)
+        if self._async_tick_id is None:
+            self._async_tick_id = self.after_idle(self._asyncio_tick)
+        return task
+
+    def _asyncio_tick(self):
+        # Run every asyncio callback that is ready right now, then return to Tk
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        # Keep ticking only while submitted work is unfinished (a finished task's
+        # done callbacks run on the next tick, which then stops the timer)
+        if self._async_tasks:
+            self._async_tick_id = self.after(self._asyncio_delay(), self._asyncio_tick)
+        else:
+            self._async_tick_id = None
+
+    def _asyncio_delay(self) -> int:
+        """Milliseconds until asyncio next has work, clamped to the poll range."""
+        # asyncio exposes no public "next deadline", so peek at the queues of
+        # CPython's BaseEventLoop; loops without them just poll at the idle rate
+        ready = getattr(self.loop, "_ready", None)
+        scheduled = getattr(self.loop, "_scheduled", None)
+        if ready is None or scheduled is None:
+            return CFG.ASYNC_POLL_MAX_MS
+        if ready:
+            return CFG.ASYNC_POLL_MIN_MS
+        if scheduled:
+            wait_ms = int((scheduled[0].when() - self.loop.time()) * 1000)
+            return max(CFG.ASYNC_POLL_MIN_MS, min(CFG.ASYNC_POLL_MAX_MS, wait_ms))
+        return CFG.ASYNC_POLL_MAX_MS
 
 if __name__ == "__main__":
-    PicrossApp().mainloop()
\ No newline at end of file
+    PicrossApp().run()
\ No newline at end of file
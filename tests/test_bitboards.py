@@ -0,0 +1,75 @@
+import importlib.util
+import random
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+# The script's file name is not importable as a module, so load it by path
+_spec = importlib.util.spec_from_file_location(
+    "picross_notepad", Path(__file__).resolve().parent.parent / "picross-notepad.py")
+picross = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(picross)
+
+PicrossGrid = picross.PicrossGrid
+CellState = picross.CellState
+DIM = picross.DIM
+
+
+def make_grid():
+    """
+    Stand-in for a PicrossGrid with just the state _update_cell and the bitmask
+    helpers touch, so they run without a display. Tk calls are recorded, not made.
+    """
+    grid = SimpleNamespace()
+    grid.grid_state = bytearray(DIM * DIM)
+    grid.filled_mask = 0
+    grid.x_mask = 0
+    grid.overlay_q_ids = [None] * (DIM * DIM)
+    empty, filled, x = object(), object(), object()
+    grid.cell_tiles = (empty, filled, x, empty)
+    grid.cell_rects = [(0, 0, 1, 1)] * (DIM * DIM)
+    grid.grid_image = None
+    grid.mark_font = None
+    grid._path = ".grid"
+    grid.tk_calls = []
+    grid._tk_call = lambda *args: grid.tk_calls.append(args)
+    grid.create_text = lambda *args, **kwargs: len(grid.tk_calls)
+    grid._state_mask = lambda state: PicrossGrid._state_mask(grid, state)
+    return grid
+
+
+def expected_bits(grid, cells, state):
+    """Bit k is set if the k-th cell of `cells` is in `state` per grid_state."""
+    return sum(1 << k for k, (row, col) in enumerate(cells)
+               if grid.grid_state[row * DIM + col] == state)
+
+
+class BitboardTest(unittest.TestCase):
+
+    def test_masks_follow_grid_state(self):
+        grid = make_grid()
+        rng = random.Random(0)
+        for _ in range(2000):
+            PicrossGrid._update_cell(grid, rng.randrange(DIM), rng.randrange(DIM),
+                                     rng.randrange(4))
+
+        for state in (CellState.FILLED, CellState.X):
+            for i in range(DIM):
+                row_cells = [(i, c) for c in range(DIM)]
+                col_cells = [(r, i) for r in range(DIM)]
+                self.assertEqual(PicrossGrid.row_bits(grid, i, state),
+                                 expected_bits(grid, row_cells, state))
+                self.assertEqual(PicrossGrid.col_bits(grid, i, state),
+                                 expected_bits(grid, col_cells, state))
+
+    def test_untracked_states_are_rejected(self):
+        grid = make_grid()
+        for state in (CellState.EMPTY, CellState.MAYBE):
+            with self.assertRaises(ValueError):
+                PicrossGrid.row_bits(grid, 0, state)
+            with self.assertRaises(ValueError):
+                PicrossGrid.col_bits(grid, 0, state)
+
+
+if __name__ == "__main__":
+    unittest.main()